@@ -2,40 +2,62 @@
 
 from version import __version__
 import os
+import calendar
 import click
+import datetime
 import dateutil
 import logging
+import numpy as np
 import pandas as pd
-import pendulum
 import re
 import sys
 from tabulate import tabulate
 
+TIME_RE = re.compile(r"Time\.(\w+)\.(.+):\s*(\d+\.?\d?)")
+ONSITE_RE = re.compile(r"onsite:\s*true")
+
+# (start month, end month, last day of end month) for each quarter.
+QUARTERS = ((1, 3, 31), (4, 6, 30), (7, 9, 30), (10, 12, 31))
 
-def extractTimeData(contents, prefix=""):
-    td = []
 
+def extractTimeColumns(contents):
     onsite = False
-    onsite_pattern = r"onsite:\s*true"
-    if re.search(onsite_pattern, contents):
+    if "onsite:" in contents and ONSITE_RE.search(contents):
         onsite = True
 
-    pattern = r"Time\.(\w+)\.(.+):\s*(\d+\.?\d?)"
-    mobj = re.findall(pattern, contents)
-    for category, name, hours in mobj:
-        if prefix:
-            td.append([prefix, category, name, float(hours), onsite])
-        else:
-            td.append([category, name, float(hours), onsite])
-    return td
+    if "Time." not in contents:
+        return [], [], [], onsite
+
+    mobj = TIME_RE.findall(contents)
+    if not mobj:
+        return [], [], [], onsite
+
+    categories, names, hours = zip(*mobj)
+    categories = list(map(sys.intern, categories))
+    names = list(map(sys.intern, names))
+    return categories, names, list(hours), onsite
+
+
+def extractTimeData(contents, prefix=""):
+    categories, names, hours, onsite = extractTimeColumns(contents)
+    hours = map(float, hours)
+    if prefix:
+        return [
+            [prefix, category, name, hrs, onsite]
+            for category, name, hrs in zip(categories, names, hours)
+        ]
+    return [
+        [category, name, hrs, onsite]
+        for category, name, hrs in zip(categories, names, hours)
+    ]
 
 
 def getSummary(df, category):
-    areadf = df.loc[df["Category"] == category].drop(columns=["Category"])
-    areadf = areadf.groupby("Name")["Hours"].sum().reset_index()
+    areadf = df.loc[df["Category"] == category, ["Name", "Hours"]]
+    areadf = areadf.groupby("Name", as_index=False, observed=True)["Hours"].sum()
     areadf = areadf.sort_values(by=["Hours"], ascending=False)
     total = areadf["Hours"].sum()
-    areadf["%"] = areadf["Hours"] / total * 100
+    areadf["%"] = areadf["Hours"] * (100.0 / total) if total else 0.0
     return areadf, total
 
 
@@ -58,17 +80,31 @@ def getFilesInRange(fpath, begin, end):
     return files
 
 
+def readFile(fpath):
+    with open(fpath, encoding="UTF-8") as f:
+        return f.read()
+
+
 def gettimedata(files):
-    timedata = []
+    filedates, fileonsite, counts = [], [], []
+    categories, names, hours = [], [], []
     for entry in files:
-        with open(entry, encoding="UTF-8") as f:
-            name = os.path.splitext(os.path.basename(entry))[0]
-            td = extractTimeData(f.read(), prefix=name)
-            if len(td) > 0:
-                timedata.extend(td)
+        cats, nms, hrs, onsite = extractTimeColumns(readFile(entry))
+        filedates.append(os.path.splitext(os.path.basename(entry))[0])
+        fileonsite.append(onsite)
+        counts.append(len(cats))
+        categories.extend(cats)
+        names.extend(nms)
+        hours.extend(hrs)
     df = pd.DataFrame(
-        timedata, columns=["Date", "Category", "Name", "Hours", "Onsite"]
-    ).astype({"Hours": "float"})
+        {
+            "Date": np.repeat(np.array(filedates, dtype=object), counts),
+            "Category": pd.Categorical(categories),
+            "Name": pd.Categorical(names),
+            "Hours": np.array(hours, dtype=float),
+            "Onsite": np.repeat(np.array(fileonsite, dtype=bool), counts),
+        }
+    )
     return df
 
 
@@ -158,70 +194,85 @@ def normalizeCategories(categories):
 ##########################################################################
 
 
+def getQuarterDates(year, quarter):
+    startmonth, endmonth, endday = QUARTERS[quarter]
+    return datetime.date(year, startmonth, 1), datetime.date(year, endmonth, endday)
+
+
+def getPeriodDates(period, today):
+    if period == "today":
+        start = end = today
+    elif period == "yesterday":
+        start = end = today - datetime.timedelta(days=1)
+    elif period == "thisweek":
+        start = today - datetime.timedelta(days=today.weekday())
+        end = start + datetime.timedelta(days=6)
+    elif period == "lastweek":
+        start = today - datetime.timedelta(days=today.weekday() + 7)
+        end = start + datetime.timedelta(days=6)
+    elif period == "thismonth":
+        start = today.replace(day=1)
+        end = today.replace(day=calendar.monthrange(today.year, today.month)[1])
+    elif period == "lastmonth":
+        end = today.replace(day=1) - datetime.timedelta(days=1)
+        start = end.replace(day=1)
+    elif period == "thisquarter":
+        start, end = getQuarterDates(today.year, (today.month - 1) // 3)
+    elif period == "lastquarter":
+        quarter = (today.month - 1) // 3
+        if quarter == 0:
+            start, end = getQuarterDates(today.year - 1, 3)
+        else:
+            start, end = getQuarterDates(today.year, quarter - 1)
+    elif period == "thisyear":
+        start = datetime.date(today.year, 1, 1)
+        end = datetime.date(today.year, 12, 31)
+    elif period == "lastyear":
+        start = datetime.date(today.year - 1, 1, 1)
+        end = datetime.date(today.year - 1, 12, 31)
+    else:
+        raise ValueError(f"Unknown period: {period}")
+    return start.isoformat(), end.isoformat()
+
+
 def get_dates_today():
-    today = pendulum.today().to_date_string()
-    return today, today
+    return getPeriodDates("today", datetime.date.today())
 
 
 def get_dates_yesterday():
-    yesterday = pendulum.yesterday().to_date_string()
-    return yesterday, yesterday
+    return getPeriodDates("yesterday", datetime.date.today())
 
 
 def get_dates_thisweek():
-    today = pendulum.today()
-    start = today.start_of("week").to_date_string()
-    end = today.end_of("week").to_date_string()
-    return start, end
+    return getPeriodDates("thisweek", datetime.date.today())
 
 
 def get_dates_lastweek():
-    lastweek = pendulum.today().subtract(weeks=1)
-    start = lastweek.start_of("week").to_date_string()
-    end = lastweek.end_of("week").to_date_string()
-    return start, end
+    return getPeriodDates("lastweek", datetime.date.today())
 
 
 def get_dates_thismonth():
-    today = pendulum.today()
-    start = today.start_of("month").to_date_string()
-    end = today.end_of("month").to_date_string()
-    return start, end
+    return getPeriodDates("thismonth", datetime.date.today())
 
 
 def get_dates_lastmonth():
-    lastmonth = pendulum.today().subtract(months=1)
-    start = lastmonth.start_of("month").to_date_string()
-    end = lastmonth.end_of("month").to_date_string()
-    return start, end
+    return getPeriodDates("lastmonth", datetime.date.today())
 
 
 def get_dates_thisquarter():
-    today = pendulum.today()
-    start = today.first_of("quarter").to_date_string()
-    end = today.last_of("quarter").to_date_string()
-    return start, end
+    return getPeriodDates("thisquarter", datetime.date.today())
 
 
 def get_dates_lastquarter():
-    lastmonth = pendulum.today().subtract(months=3)
-    start = lastmonth.first_of("quarter").to_date_string()
-    end = lastmonth.last_of("quarter").to_date_string()
-    return start, end
+    return getPeriodDates("lastquarter", datetime.date.today())
 
 
 def get_dates_thisyear():
-    today = pendulum.today()
-    start = today.start_of("year").to_date_string()
-    end = today.end_of("year").to_date_string()
-    return start, end
+    return getPeriodDates("thisyear", datetime.date.today())
 
 
 def get_dates_lastyear():
-    lastyear = pendulum.today().subtract(years=1)
-    start = lastyear.start_of("year").to_date_string()
-    end = lastyear.end_of("year").to_date_string()
-    return start, end
+    return getPeriodDates("lastyear", datetime.date.today())
 
 
 def get_dates(
@@ -297,13 +348,13 @@ def get_dates(
 @click.option(
     "--from",
     "from_",
-    default=pendulum.today(),
+    default=datetime.datetime.today(),
     help="Start of time tracking period (default is today).",
     type=click.DateTime(),
 )
 @click.option(
     "--to",
-    default=pendulum.today(),
+    default=datetime.datetime.today(),
     help="End of time tracking period (default is today).",
     type=click.DateTime(),
 )
@@ -1,3 +1,4 @@
+import datetime
 import unittest
 from unittest.mock import patch, mock_open
 import mytime as mt
@@ -6,38 +7,75 @@ import pendulum
 
 
 class TestMyTime(unittest.TestCase):
+    MOCK_F1 = """
+            Time.Area.Managing: 1
+            Time.Area.Collab.Meetings: 3
+            Time.Area.Collab.Email: 2
+            Time.Area.DeepWork: 4"""
+    MOCK_F2 = """
+            Time.Area.Managing: 2
+            Time.Area.Collab.Meetings: 2.5
+            Time.Area.Collab.Email: 1.5
+            Time.Area.DeepWork: 3"""
+    EXPECTED_F1 = [
+        ["2023-10-16", "Area", "Managing", 1.0, False],
+        ["2023-10-16", "Area", "Collab.Meetings", 3.0, False],
+        ["2023-10-16", "Area", "Collab.Email", 2.0, False],
+        ["2023-10-16", "Area", "DeepWork", 4.0, False],
+    ]
+    EXPECTED_F2 = [
+        ["2023-10-17", "Area", "Managing", 2.0, False],
+        ["2023-10-17", "Area", "Collab.Meetings", 2.5, False],
+        ["2023-10-17", "Area", "Collab.Email", 1.5, False],
+        ["2023-10-17", "Area", "DeepWork", 3, False],
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.today = pendulum.today()
+
     def test_get_dates_today(self):
         start, end = mt.get_dates_today()
-        expected_start = pendulum.today().to_date_string()
-        expected_end = pendulum.today().to_date_string()
+        expected_start = self.today.to_date_string()
+        expected_end = self.today.to_date_string()
         self.assertEqual(start, expected_start, "Incorrect start date")
         self.assertEqual(end, expected_end, "Incorrect end date")
 
     def test_get_dates_thisweek(self):
         start, end = mt.get_dates_thisweek()
-        expected_start = pendulum.today().start_of("week").to_date_string()
-        expected_end = pendulum.today().end_of("week").to_date_string()
+        expected_start = self.today.start_of("week").to_date_string()
+        expected_end = self.today.end_of("week").to_date_string()
         self.assertEqual(start, expected_start, "Incorrect start date")
         self.assertEqual(end, expected_end, "Incorrect end date")
 
     def test_get_dates_lastweek(self):
         start, end = mt.get_dates_lastweek()
-        expected_start = (
-            pendulum.today().subtract(weeks=1).start_of("week").to_date_string()
-        )
-        expected_end = (
-            pendulum.today().subtract(weeks=1).end_of("week").to_date_string()
-        )
+        expected_start = self.today.subtract(weeks=1).start_of("week").to_date_string()
+        expected_end = self.today.subtract(weeks=1).end_of("week").to_date_string()
         self.assertEqual(start, expected_start, "Incorrect start date")
         self.assertEqual(end, expected_end, "Incorrect end date")
 
     def test_get_dates_thisquarter(self):
         start, end = mt.get_dates_thisquarter()
-        expected_start = pendulum.today().first_of("quarter").to_date_string()
-        expected_end = pendulum.today().last_of("quarter").to_date_string()
+        expected_start = self.today.first_of("quarter").to_date_string()
+        expected_end = self.today.last_of("quarter").to_date_string()
         self.assertEqual(start, expected_start, "Incorrect start date")
         self.assertEqual(end, expected_end, "Incorrect end date")
 
+    def test_getPeriodDates(self):
+        day = datetime.date(2024, 2, 29)
+        self.assertEqual(
+            mt.getPeriodDates("lastmonth", day), ("2024-01-01", "2024-01-31")
+        )
+        self.assertEqual(
+            mt.getPeriodDates("thisquarter", day), ("2024-01-01", "2024-03-31")
+        )
+        self.assertEqual(
+            mt.getPeriodDates("lastquarter", day), ("2023-10-01", "2023-12-31")
+        )
+        with self.assertRaises(ValueError):
+            mt.getPeriodDates("fortnight", day)
+
     def test_area_parsing(self):
         time_str = r"""
             Time.Area.Managing: 4.5
@@ -65,6 +103,15 @@ class TestMyTime(unittest.TestCase):
             mt.extractTimeData(time_str), [["Area", "Managing", 4.5, False]]
         )
 
+    def test_timedata_parsing_list_items(self):
+        time_str = r"""
+            - Time.Proj.Sample: 2.5
+            * Time.Area.Collab.Meeting: 3
+        """
+        parsed = mt.extractTimeData(time_str)
+        self.assertIn(["Proj", "Sample", 2.5, False], parsed)
+        self.assertIn(["Area", "Collab.Meeting", 3, False], parsed)
+
     def test_timedata_parsing(self):
         time_str = r"""
             Time.Overhead.Managing: 4.5
@@ -95,6 +142,18 @@ class TestMyTime(unittest.TestCase):
         self.assertIn(["Prefix", "Area", "Collab", 0.5, False], parsed)
         self.assertIn(["Prefix", "Area", "Collab.Meeting", 3, False], parsed)
 
+    def test_extractTimeColumns(self):
+        time_str = r"""
+            onsite: true
+            Time.Proj.Sample: 2.5
+            Time.Area.Collab.Meeting: 3
+        """
+        categories, names, hours, onsite = mt.extractTimeColumns(time_str)
+        self.assertEqual(categories, ["Proj", "Area"])
+        self.assertEqual(names, ["Sample", "Collab.Meeting"])
+        self.assertEqual(hours, ["2.5", "3"])
+        self.assertTrue(onsite)
+
     def test_getAreaSummary(self):
         input = pd.DataFrame(
             [
@@ -115,57 +174,59 @@ class TestMyTime(unittest.TestCase):
         self.assertEqual(total, expected_total)
 
     def test_gettimedata(self):
-        mock_content = """
-            Time.Area.Managing: 1
-            Time.Area.Collab.Meetings: 3
-            Time.Area.Collab.Email: 2
-            Time.Area.DeepWork: 4"""
-        expected = [
-            ["2023-10-16", "Area", "Managing", 1.0, False],
-            ["2023-10-16", "Area", "Collab.Meetings", 3.0, False],
-            ["2023-10-16", "Area", "Collab.Email", 2.0, False],
-            ["2023-10-16", "Area", "DeepWork", 4.0, False],
-        ]
-
-        with patch("builtins.open", new=mock_open(read_data=mock_content)) as mock_file:
+        with patch("builtins.open", new=mock_open(read_data=self.MOCK_F1)) as mock_file:
             fname = "./2023-10-16.md"
             td = mt.gettimedata([fname])
             mock_file.assert_called_with("./2023-10-16.md", encoding="UTF-8")
             self.assertEqual(len(td), 4)
-            self.assertEqual(td.values.tolist(), expected)
+            self.assertEqual(td.values.tolist(), self.EXPECTED_F1)
+
+    def test_gettimedata_column_dtypes(self):
+        with patch("builtins.open", new=mock_open(read_data=self.MOCK_F1)):
+            td = mt.gettimedata(["./2023-10-16.md"])
+            self.assertEqual(td["Category"].dtype, "category")
+            self.assertEqual(td["Name"].dtype, "category")
+            self.assertEqual(td["Hours"].dtype, "float64")
+            self.assertEqual(td["Onsite"].dtype, "bool")
+
+    def test_gettimedata_no_entries(self):
+        with patch("builtins.open", new=mock_open(read_data="No time entries")):
+            td = mt.gettimedata(["./2023-10-16.md"])
+            self.assertTrue(td.empty)
+            self.assertEqual(mt.getOnsiteDays(td), 0)
+            areas, total = mt.getSummary(td, "Area")
+            self.assertTrue(areas.empty)
+            self.assertEqual(total, 0)
+        self.assertTrue(mt.gettimedata([]).empty)
 
     @patch("builtins.open", new_callable=mock_open)
     def test_gettimedata_multifile(self, mo):
-        mock_f1 = """
-            Time.Area.Managing: 1
-            Time.Area.Collab.Meetings: 3
-            Time.Area.Collab.Email: 2
-            Time.Area.DeepWork: 4"""
-        mock_f2 = """
-            Time.Area.Managing: 2
-            Time.Area.Collab.Meetings: 2.5
-            Time.Area.Collab.Email: 1.5
-            Time.Area.DeepWork: 3"""
-        expected = [
-            ["2023-10-16", "Area", "Managing", 1.0, False],
-            ["2023-10-16", "Area", "Collab.Meetings", 3.0, False],
-            ["2023-10-16", "Area", "Collab.Email", 2.0, False],
-            ["2023-10-16", "Area", "DeepWork", 4.0, False],
-            ["2023-10-17", "Area", "Managing", 2.0, False],
-            ["2023-10-17", "Area", "Collab.Meetings", 2.5, False],
-            ["2023-10-17", "Area", "Collab.Email", 1.5, False],
-            ["2023-10-17", "Area", "DeepWork", 3, False],
-        ]
-
         f1name = "2023-10-16.md"
         f2name = "2023-10-17.md"
         handlers = (
-            mock_open(read_data=mock_f1).return_value,
-            mock_open(read_data=mock_f2).return_value,
+            mock_open(read_data=self.MOCK_F1).return_value,
+            mock_open(read_data=self.MOCK_F2).return_value,
         )
         mo.side_effect = handlers
         td = mt.gettimedata([f1name, f2name])
         self.assertEqual(len(td), 8)
+        self.assertEqual(td.values.tolist(), self.EXPECTED_F1 + self.EXPECTED_F2)
+
+    @patch("builtins.open")
+    def test_gettimedata_many_files(self, mo):
+        contents = {
+            f"2023-10-{day:02}.md": f"Time.Area.Managing: {day}" for day in range(1, 21)
+        }
+
+        def open_file(fname, **kwargs):
+            return mock_open(read_data=contents[fname]).return_value
+
+        mo.side_effect = open_file
+        td = mt.gettimedata(list(contents))
+        expected = [
+            [f"2023-10-{day:02}", "Area", "Managing", float(day), False]
+            for day in range(1, 21)
+        ]
         self.assertEqual(td.values.tolist(), expected)
 
     def test_onsite(self):